@@ -9,6 +9,10 @@ valid credentials.
 """
 
 import asyncio
+import io
+import os
+import sys
+import tempfile
 from pathlib import Path
 
 from utcp.utcp_client import UtcpClient
@@ -19,20 +23,40 @@ from utcp.data.auth_implementations.basic_auth import BasicAuth
 from utcp.data.auth_implementations.oauth2_auth import OAuth2Auth
 from langchain_utcp_adapters import load_utcp_tools
 
+SUMMARY = """\
+📚 Summary of Authentication Methods:
+   • API Key: Most common, key in header or query parameter
+   • Basic Auth: Username/password, base64 encoded
+   • OAuth2: Token-based, requires client credentials
+   • Environment Variables: Secure credential storage
 
-async def demonstrate_api_key_auth():
+💡 Best Practices:
+   • Never hardcode credentials in source code
+   • Use environment variables for sensitive data
+   • Rotate API keys regularly
+   • Use least-privilege access scopes
+
+✅ Authentication examples completed!
+"""
+
+
+def registration_error(result) -> str:
+    """Return a one-line summary of a failed manual registration."""
+    # errors holds full tracebacks; the last line names the failure
+    return result.errors[-1].splitlines()[-1] if result.errors else "unknown error"
+
+
+async def demonstrate_api_key_auth(client: UtcpClient):
     """Demonstrate API key authentication with a working test endpoint."""
-    print("🔑 API Key Authentication Example")
-    print("-" * 40)
-    
-    config = UtcpClientConfig()
-    client = await UtcpClient.create(config=config)
+    out = io.StringIO()
+    print("🔑 API Key Authentication Example", file=out)
+    print("-" * 40, file=out)
     
-    # Example 1: API key in header (most common)
-    api_key_provider = HttpProvider(
+    # API key in header (most common)
+    api_key_provider = HttpCallTemplate(
         name="httpbin_headers",
-        provider_type="http",
-        url="http://httpbin.org/headers",
+        call_template_type="http",
+        url="https://httpbin.org/headers",
         http_method="GET",
         auth=ApiKeyAuth(
             api_key="demo-api-key-12345",
@@ -42,35 +66,36 @@ async def demonstrate_api_key_auth():
     )
     
     try:
-        await client.register_tool_provider(api_key_provider)
-        tools = await load_utcp_tools(client, provider_name="httpbin_headers")
+        result = await client.register_manual(api_key_provider)
+        if not result.success:
+            raise RuntimeError(registration_error(result))
+        tools = await load_utcp_tools(client, call_template_name="httpbin_headers")
         
         if tools:
-            print(f"✅ Successfully registered provider with API key auth")
-            print(f"   Tool: {tools[0].name}")
-            print(f"   Auth: API key in header 'X-API-Key'")
+            print(f"✅ Successfully registered provider with API key auth", file=out)
+            print(f"   Tool: {tools[0].name}", file=out)
+            print(f"   Auth: API key in header 'X-API-Key'", file=out)
         else:
-            print("⚠️  Provider registered but no tools found")
+            print("⚠️  Provider registered but no tools found", file=out)
             
     except Exception as e:
-        print(f"❌ API key auth failed: {e}")
+        print(f"❌ API key auth failed: {e}", file=out)
     
-    print()
+    print(file=out)
+    return out.getvalue()
 
 
-async def demonstrate_basic_auth():
+async def demonstrate_basic_auth(client: UtcpClient):
     """Demonstrate basic authentication with HTTPBin test endpoint."""
-    print("🔐 Basic Authentication Example")
-    print("-" * 40)
-    
-    config = UtcpClientConfig()
-    client = await UtcpClient.create(config=config)
+    out = io.StringIO()
+    print("🔐 Basic Authentication Example", file=out)
+    print("-" * 40, file=out)
     
     # HTTPBin provides a working basic auth test endpoint
-    basic_auth_provider = HttpProvider(
+    basic_auth_provider = HttpCallTemplate(
         name="httpbin_basic_auth",
-        provider_type="http",
-        url="http://httpbin.org/basic-auth/testuser/testpass",
+        call_template_type="http",
+        url="https://httpbin.org/basic-auth/testuser/testpass",
         http_method="GET",
         auth=BasicAuth(
             username="testuser",
@@ -79,34 +104,38 @@ async def demonstrate_basic_auth():
     )
     
     try:
-        await client.register_tool_provider(basic_auth_provider)
-        tools = await load_utcp_tools(client, provider_name="httpbin_basic_auth")
+        result = await client.register_manual(basic_auth_provider)
+        if not result.success:
+            raise RuntimeError(registration_error(result))
+        tools = await load_utcp_tools(client, call_template_name="httpbin_basic_auth")
         
         if tools:
-            print(f"✅ Successfully registered provider with basic auth")
-            print(f"   Tool: {tools[0].name}")
-            print(f"   Auth: Basic authentication (username/password)")
+            print(f"✅ Successfully registered provider with basic auth", file=out)
+            print(f"   Tool: {tools[0].name}", file=out)
+            print(f"   Auth: Basic authentication (username/password)", file=out)
         else:
-            print("⚠️  Provider registered but no tools found")
+            print("⚠️  Provider registered but no tools found", file=out)
             
     except Exception as e:
-        print(f"❌ Basic auth failed: {e}")
+        print(f"❌ Basic auth failed: {e}", file=out)
     
-    print()
+    print(file=out)
+    return out.getvalue()
 
 
-async def demonstrate_oauth2_auth():
+async def demonstrate_oauth2_auth(client: UtcpClient):
     """Demonstrate OAuth2 authentication configuration."""
-    print("🌐 OAuth2 Authentication Example")
-    print("-" * 40)
+    out = io.StringIO()
+    print("🌐 OAuth2 Authentication Example", file=out)
+    print("-" * 40, file=out)
     
-    config = UtcpClientConfig()
-    client = await UtcpClient.create(config=config)
-    
-    # OAuth2 example (this would require real OAuth2 endpoints)
-    oauth2_provider = HttpProvider(
+    # OAuth2 example (this would require real OAuth2 endpoints). The HTTP
+    # protocol caches access tokens per credential configuration (token URL,
+    # client id, secret and scope), so every call made through the same client
+    # reuses one token instead of fetching a new one per request.
+    oauth2_provider = HttpCallTemplate(
         name="oauth2_demo",
-        provider_type="http",
+        call_template_type="http",
         url="https://api.github.com",  # GitHub API as example
         http_method="GET",
         auth=OAuth2Auth(
@@ -119,29 +148,33 @@ async def demonstrate_oauth2_auth():
     
     try:
         # This will fail without real credentials, but shows the pattern
-        await client.register_tool_provider(oauth2_provider)
-        tools = await load_utcp_tools(client, provider_name="oauth2_demo")
+        result = await client.register_manual(oauth2_provider)
+        if not result.success:
+            raise RuntimeError(registration_error(result))
+        tools = await load_utcp_tools(client, call_template_name="oauth2_demo")
         
         if tools:
-            print(f"✅ Successfully registered provider with OAuth2")
-            print(f"   Tools found: {len(tools)}")
+            print(f"✅ Successfully registered provider with OAuth2", file=out)
+            print(f"   Tools found: {len(tools)}", file=out)
         else:
-            print("⚠️  Provider registered but no tools found")
+            print("⚠️  Provider registered but no tools found", file=out)
             
     except Exception as e:
-        print(f"❌ OAuth2 auth failed (expected without real credentials): {e}")
-        print("   This demonstrates the OAuth2 configuration pattern")
+        print(f"❌ OAuth2 auth failed (expected without real credentials): {e}", file=out)
+        print("   This demonstrates the OAuth2 configuration pattern", file=out)
     
-    print()
+    print(file=out)
+    return out.getvalue()
 
 
 async def demonstrate_environment_variables():
     """Show how to use environment variables for credentials."""
-    print("🌍 Environment Variables for Authentication")
-    print("-" * 40)
+    out = io.StringIO()
+    print("🌍 Environment Variables for Authentication", file=out)
+    print("-" * 40, file=out)
     
-    # Create a temporary .env file for demonstration
-    env_file = Path(".env.demo")
+    # Create a temporary .env file for demonstration. A unique temp file keeps
+    # concurrent runs from racing on a shared path.
     env_content = """# Demo environment variables for authentication
 API_KEY=demo-key-from-env
 OAUTH_CLIENT_ID=demo-client-id
@@ -150,32 +183,30 @@ BASIC_USERNAME=demo-user
 BASIC_PASSWORD=demo-pass
 """
     
-    with open(env_file, "w") as f:
-        f.write(env_content)
+    fd, env_path = tempfile.mkstemp(suffix=".env")
+    with os.fdopen(fd, "wb") as f:
+        f.write(env_content.encode("utf-8"))
+    env_file = Path(env_path)
     
-    print("📝 Created demo .env file with example credentials")
-    print("   In real usage, you would set these environment variables:")
-    print("   export API_KEY=your_real_api_key")
-    print("   export OAUTH_CLIENT_ID=your_real_client_id")
-    print("   # etc.")
-    print()
+    print("📝 Created demo .env file with example credentials", file=out)
+    print("   In real usage, you would set these environment variables:", file=out)
+    print("   export API_KEY=your_real_api_key", file=out)
+    print("   export OAUTH_CLIENT_ID=your_real_client_id", file=out)
+    print("   # etc.", file=out)
+    print(file=out)
     
     # Show how to reference environment variables in auth config
-    print("🔧 Authentication with environment variables:")
-    print("   API Key: ${API_KEY}")
-    print("   OAuth Client ID: ${OAUTH_CLIENT_ID}")
-    print("   Basic Auth Username: ${BASIC_USERNAME}")
-    print()
+    print("🔧 Authentication with environment variables:", file=out)
+    print("   API Key: ${API_KEY}", file=out)
+    print("   OAuth Client ID: ${OAUTH_CLIENT_ID}", file=out)
+    print("   Basic Auth Username: ${BASIC_USERNAME}", file=out)
+    print(file=out)
     
     # Example of using environment variables in provider config
-    config = UtcpClientConfig()
-    client = await UtcpClient.create(config=config)
-    
-    # This would use environment variables if they were set
-    env_provider = HttpProvider(
+    env_auth_provider = HttpCallTemplate(
         name="env_auth_demo",
-        provider_type="http",
-        url="http://httpbin.org/headers",
+        call_template_type="http",
+        url="https://httpbin.org/headers",
         http_method="GET",
         auth=ApiKeyAuth(
             api_key="${API_KEY}",  # Would be replaced with env var value
@@ -184,13 +215,13 @@ BASIC_PASSWORD=demo-pass
         )
     )
     
-    print("✅ Provider configured to use ${API_KEY} environment variable")
+    print(f"✅ Provider '{env_auth_provider.name}' configured to use ${{API_KEY}} environment variable", file=out)
     
     # Clean up
-    if env_file.exists():
-        env_file.unlink()
+    env_file.unlink(missing_ok=True)
     
-    print()
+    print(file=out)
+    return out.getvalue()
 
 
 async def main():
@@ -201,24 +232,33 @@ async def main():
     print("These patterns work with real APIs that require authentication.")
     print()
     
-    await demonstrate_api_key_auth()
-    await demonstrate_basic_auth()
-    await demonstrate_oauth2_auth()
-    await demonstrate_environment_variables()
+    # Share one UTCP client across all demos so its communication protocols
+    # (and their connection and token state) are created once, not per demo
+    client = await UtcpClient.create(config=UtcpClientConfig())
+    try:
+        # The demos do independent network I/O, so run them concurrently.
+        # Each one buffers its own output, which is printed in order afterwards.
+        demos = {
+            "API key authentication": demonstrate_api_key_auth(client),
+            "Basic authentication": demonstrate_basic_auth(client),
+            "OAuth2 authentication": demonstrate_oauth2_auth(client),
+            "Environment variables": demonstrate_environment_variables(),
+        }
+        results = await asyncio.gather(*demos.values(), return_exceptions=True)
+    finally:
+        await client.close()
     
-    print("📚 Summary of Authentication Methods:")
-    print("   • API Key: Most common, key in header or query parameter")
-    print("   • Basic Auth: Username/password, base64 encoded")
-    print("   • OAuth2: Token-based, requires client credentials")
-    print("   • Environment Variables: Secure credential storage")
-    print()
-    print("💡 Best Practices:")
-    print("   • Never hardcode credentials in source code")
-    print("   • Use environment variables for sensitive data")
-    print("   • Rotate API keys regularly")
-    print("   • Use least-privilege access scopes")
-    print()
-    print("✅ Authentication examples completed!")
+    # Collect everything that follows into one buffer and write it in one go
+    out = io.StringIO()
+    for name, result in zip(demos, results):
+        if isinstance(result, Exception):
+            print(f"❌ {name} demo failed: {result}", file=out)
+            print(file=out)
+        else:
+            out.write(result)
+    out.write(SUMMARY)
+    sys.stdout.write(out.getvalue())
+    sys.stdout.flush()
 
 
 if __name__ == "__main__":
@@ -7,18 +7,28 @@ This example demonstrates how to:
 """
 
 import asyncio
+import logging
+from operator import itemgetter
 from utcp.utcp_client import UtcpClient
 from utcp.data.utcp_client_config import UtcpClientConfig
 from utcp_http.http_call_template import HttpCallTemplate
 from langchain_utcp_adapters import load_utcp_tools, search_utcp_tools
 
+logger = logging.getLogger(__name__)
+
+# Metadata fields shown for each tool. The adapter always sets these keys,
+# so they are fetched in one call without per-key defaults.
+display_fields = itemgetter("call_template", "call_template_type", "tags")
+
 
 async def main():
     """Main example function."""
     print("🚀 Basic LangChain UTCP Adapters Usage (UTCP 1.0.0+)")
     print("=" * 50)
     
-    # Create UTCP client with new 1.0.0+ configuration
+    # Create UTCP client with new 1.0.0+ configuration. UtcpClient.create()
+    # fetches the OpenAPI specs of all manual_call_templates concurrently, so
+    # listing them here costs max(fetch time) rather than the sum.
     print("📡 Creating UTCP client...")
     config = UtcpClientConfig(
         manual_call_templates=[
@@ -46,11 +56,15 @@ async def main():
     tools = await load_utcp_tools(client)
     print(f"Found {len(tools)} LangChain tools:")
     
+    lines = []
     for tool in tools[:5]:  # Show first 5 tools
-        print(f"  - {tool.name}: {tool.description}")
-        print(f"    Call Template: {tool.metadata.get('call_template', 'unknown')}")
-        print(f"    Type: {tool.metadata.get('call_template_type', 'unknown')}")
-        print(f"    Tags: {tool.metadata.get('tags', [])}")
+        call_template, call_template_type, tags = display_fields(tool.metadata)
+        lines.append(f"  - {tool.name}: {tool.description}")
+        lines.append(f"    Call Template: {call_template}")
+        lines.append(f"    Type: {call_template_type}")
+        lines.append(f"    Tags: {tags}")
+    if lines:
+        print("\n".join(lines))
     
     if len(tools) > 5:
         print(f"  ... and {len(tools) - 5} more tools")
@@ -67,14 +81,15 @@ async def main():
     if tools:
         print(f"\n🔧 Example tool schema for '{tools[0].name}':")
         print(f"  Description: {tools[0].description}")
-        print(f"  Args schema: {tools[0].args_schema}")
+        # Diagnostic only; enable DEBUG logging to see it
+        logger.debug("Args schema: %s", tools[0].args_schema)
         print(f"  Metadata: {tools[0].metadata}")
         
         # Show how the tool would be called
         print(f"\n💡 Usage example:")
         print(f"    # To call this tool:")
         print(f"    # result = await {tools[0].name}(**arguments)")
-        print(f"    # where arguments match the schema above")
+        print(f"    # where arguments match the tool's args schema")
     
     if not tools:
         print("\n⚠️  No tools were loaded. This might be because:")
@@ -21,9 +21,12 @@ except ImportError:
     BEDROCK_AVAILABLE = False
     print("Bedrock dependencies not available. Install with: pip install langchain-aws boto3")
 
+# Use Claude 3 Haiku (fast and cost-effective)
+MODEL_ID = "anthropic.claude-3-haiku-20240307-v1:0"
 
-def check_aws_credentials():
-    """Check if AWS credentials are configured."""
+
+def _check_aws_credentials_sync():
+    """Check if AWS credentials are configured (blocking)."""
     try:
         # Try to create a session to check credentials
         session = boto3.Session()
@@ -34,8 +37,9 @@ def check_aws_credentials():
         # Check if we can access Bedrock
         bedrock_client = session.client('bedrock', region_name='us-east-1')
         try:
-            # Try to list foundation models to verify access
-            bedrock_client.list_foundation_models()
+            # Look up just the model this example uses to verify access. This
+            # is a much smaller response than listing every foundation model.
+            bedrock_client.get_foundation_model(modelIdentifier=MODEL_ID)
             return True, "AWS credentials and Bedrock access verified"
         except Exception as e:
             return False, f"Bedrock access error: {str(e)}"
@@ -44,6 +48,27 @@ def check_aws_credentials():
         return False, f"AWS credential error: {str(e)}"
 
 
+def create_bedrock_llm(model_id):
+    """Create the Bedrock chat model (blocking: builds the boto3 client)."""
+    return ChatBedrock(
+        model_id=model_id,
+        region_name="us-east-1",
+        model_kwargs={
+            "temperature": 0.1,
+            "max_tokens": 500,
+        }
+    )
+
+
+async def check_aws_credentials():
+    """Check if AWS credentials are configured.
+
+    boto3 is synchronous and GetFoundationModel is a network call, so the
+    check runs in a worker thread rather than blocking the event loop.
+    """
+    return await asyncio.to_thread(_check_aws_credentials_sync)
+
+
 # Removed server creation code - this is CLIENT-SIDE only
 # LangChain UTCP Adapters should consume existing APIs, not create servers
 
@@ -60,7 +85,7 @@ async def main():
     
     # Check AWS credentials and Bedrock access
     print("🔍 Checking AWS credentials and Bedrock access...")
-    creds_ok, creds_msg = check_aws_credentials()
+    creds_ok, creds_msg = await check_aws_credentials()
     print(f"AWS Status: {creds_msg}")
     
     if not creds_ok:
@@ -74,10 +99,8 @@ async def main():
         print("- Request access to foundation models in Bedrock console")
         return
     
-    # Create UTCP client directly
-    print("\n📡 Creating UTCP client...")
     # Create UTCP client with call templates
-    print("📡 Creating UTCP client...")
+    print("\n📡 Creating UTCP client...")
     config = UtcpClientConfig(
         manual_call_templates=[
             HttpCallTemplate(
@@ -94,9 +117,22 @@ async def main():
     print("✅ Successfully created UTCP client with call templates")
     
     try:
-        # Load tools
+        model_id = MODEL_ID
+        
+        # Load tools. The Bedrock model is built in a worker thread meanwhile,
+        # so its client setup overlaps the tool loading instead of following it.
+        # The test queries below often repeat the same lookups, so results of
+        # read-only (GET/HEAD) tool calls are cached for the run; identical
+        # calls made by concurrent queries share one request.
         print("\n🔧 Loading tools...")
-        original_tools = await load_utcp_tools(client)
+        original_tools, llm = await asyncio.gather(
+            load_utcp_tools(client, cache_policy="safe-only"),
+            asyncio.to_thread(create_bedrock_llm, model_id),
+            return_exceptions=True,
+        )
+        if isinstance(original_tools, Exception):
+            # Only the model build is reported below; a failed tool load is fatal
+            raise original_tools
         print(f"Found {len(original_tools)} tools")
         
         if not original_tools:
@@ -106,6 +142,8 @@ async def main():
         # Create Bedrock-compatible tools
         print("🔧 Creating Bedrock-compatible tool names...")
         bedrock_tools, name_mapping = create_bedrock_tool_mapping(original_tools)
+        # Original name -> Bedrock name, for looking up search results below
+        bedrock_names = {o_name: b_name for b_name, o_name in name_mapping.items()}
         
         # Show name mappings for long tool names
         long_names = [name for name in name_mapping.keys() if name != name_mapping[name]]
@@ -115,21 +153,12 @@ async def main():
                 if bedrock_name != original_name:
                     print(f"  {original_name} -> {bedrock_name}")
         
-        # Create Bedrock LLM
+        # Check the Bedrock model built alongside the tools
         print("\n🤖 Initializing Amazon Bedrock...")
         
-        # Use Claude 3 Haiku (fast and cost-effective)
-        model_id = "anthropic.claude-3-haiku-20240307-v1:0"
-        
         try:
-            llm = ChatBedrock(
-                model_id=model_id,
-                region_name="us-east-1",
-                model_kwargs={
-                    "temperature": 0.1,
-                    "max_tokens": 500,
-                }
-            )
+            if isinstance(llm, Exception):
+                raise llm
             print(f"✅ Bedrock model initialized: {model_id}")
         except Exception as e:
             print(f"❌ Bedrock initialization failed: {e}")
@@ -151,15 +180,21 @@ async def main():
             "Help me understand what you can do with the available tools"
         ]
         
-        for i, query in enumerate(test_queries, 1):
+        # The queries are independent, so run them concurrently and print
+        # the results in order once they are all done
+        responses = await asyncio.gather(
+            *(agent.ainvoke({"messages": [("user", query)]}) for query in test_queries),
+            return_exceptions=True,
+        )
+        
+        for i, (query, response) in enumerate(zip(test_queries, responses), 1):
             print(f"\n{'='*50}")
             print(f"Test {i}: {query}")
             print('='*50)
             
             try:
-                response = await agent.ainvoke({
-                    "messages": [("user", query)]
-                })
+                if isinstance(response, Exception):
+                    raise response
                 
                 # Get the final response
                 final_message = response["messages"][-1]
@@ -188,20 +223,18 @@ async def main():
         print('='*50)
         
         search_queries = ["books", "http", "api"]
-        for search_query in search_queries:
+        all_search_results = await asyncio.gather(
+            *(search_utcp_tools(client, query, max_results=3) for query in search_queries)
+        )
+        for search_query, search_results in zip(search_queries, all_search_results):
             print(f"\n🔍 Searching for: '{search_query}'")
-            search_results = await search_utcp_tools(client, search_query, max_results=3)
             
             if search_results:
                 for tool in search_results:
-                    provider = tool.metadata.get('provider', 'unknown')
+                    provider = tool.metadata.get('manual_name', 'unknown')
                     original_name = tool.name
                     # Find the corresponding Bedrock name
-                    bedrock_name = None
-                    for b_name, o_name in name_mapping.items():
-                        if o_name == original_name:
-                            bedrock_name = b_name
-                            break
+                    bedrock_name = bedrock_names.get(original_name)
                     
                     if bedrock_name and bedrock_name != original_name:
                         print(f"  ✅ {original_name} -> {bedrock_name} ({provider})")
@@ -212,8 +245,9 @@ async def main():
         
     finally:
         print("\n🧹 Cleaning up...")
-        # No providers file to clean up in direct approach
-        pass
+        # The one client (and its protocol state) served every query above;
+        # release it once at the end
+        await client.close()
     
     print(f"\n{'='*50}")
     print("✅ Example completed successfully!")
@@ -23,6 +23,11 @@ except ImportError:
     print("Install Bedrock dependencies: pip install langchain-aws boto3")
 
 
+def get_aws_credentials():
+    """Look up AWS credentials (blocking: may query the instance metadata service)."""
+    return boto3.Session().get_credentials()
+
+
 async def main():
     """Simple Bedrock integration example."""
     print("🤖 Simple Amazon Bedrock + UTCP Integration")
@@ -33,23 +38,24 @@ async def main():
         print("Install with: pdm install -G bedrock")
         return
     
-    # Check AWS credentials
+    # Check AWS credentials in a worker thread so the blocking boto3 lookup
+    # doesn't stall the event loop. The UTCP client is only created once the
+    # check passes, so the early returns below have nothing to clean up.
+    print("📡 Checking AWS credentials...")
     try:
-        session = boto3.Session()
-        credentials = session.get_credentials()
-        if not credentials:
-            print("❌ No AWS credentials found")
-            print("Run 'aws configure' or set environment variables:")
-            print("  export AWS_ACCESS_KEY_ID=your_key")
-            print("  export AWS_SECRET_ACCESS_KEY=your_secret")
-            print("  export AWS_DEFAULT_REGION=us-east-1")
-            return
-        print("✅ AWS credentials found")
+        credentials = await asyncio.to_thread(get_aws_credentials)
     except Exception as e:
         print(f"❌ AWS credential error: {e}")
         return
+    if not credentials:
+        print("❌ No AWS credentials found")
+        print("Run 'aws configure' or set environment variables:")
+        print("  export AWS_ACCESS_KEY_ID=your_key")
+        print("  export AWS_SECRET_ACCESS_KEY=your_secret")
+        print("  export AWS_DEFAULT_REGION=us-east-1")
+        return
+    print("✅ AWS credentials found")
     
-    # Create UTCP client
     print("📡 Setting up UTCP client...")
     config = UtcpClientConfig()
     client = await UtcpClient.create(config=config)
@@ -22,30 +22,38 @@ async def main():
     config = UtcpClientConfig()
     client = await UtcpClient.create(config=config)
     
-    # Register providers dynamically using Provider objects
+    # Register providers dynamically using call templates
     print("📡 Registering providers...")
     
-    # Register OpenLibrary provider
-    openlibrary_provider = HttpProvider(
+    # OpenLibrary provider
+    openlibrary_provider = HttpCallTemplate(
         name="openlibrary",
-        provider_type="http",
+        call_template_type="http",
         http_method="GET",
         url="https://openlibrary.org/static/openapi.json",
         content_type="application/json"
     )
-    await client.register_tool_provider(openlibrary_provider)
     
-    # Register a simple HTTP test provider
-    httpbin_provider = HttpProvider(
+    # A simple HTTP test provider
+    httpbin_provider = HttpCallTemplate(
         name="httpbin",
-        provider_type="http",
+        call_template_type="http",
         http_method="POST",
-        url="http://httpbin.org/anything",
+        url="https://httpbin.org/anything",
         content_type="application/json"
     )
-    await client.register_tool_provider(httpbin_provider)
     
-    print("✅ Providers registered successfully")
+    # Register both in one call; UTCP runs the discovery requests concurrently
+    providers = [openlibrary_provider, httpbin_provider]
+    results = await client.register_manuals(providers)
+    
+    for provider, result in zip(providers, results):
+        if result.success:
+            print(f"  ✅ Registered {provider.name}")
+        else:
+            # errors holds full tracebacks; the last line names the failure
+            error = result.errors[-1].splitlines()[-1] if result.errors else "unknown error"
+            print(f"  ❌ Failed to register {provider.name}: {error}")
     
     # Load all tools and convert to LangChain format
     print("\n🔧 Loading tools...")
@@ -55,7 +63,7 @@ async def main():
     for tool in tools:
         print(f"  - {tool.name}")
         print(f"    Description: {tool.description}")
-        print(f"    Provider: {tool.metadata.get('provider')}")
+        print(f"    Provider: {tool.metadata.get('manual_name')}")
         print()
     
     # Search for specific tools
@@ -6,6 +6,7 @@ including multiple providers, error handling, and tool search functionality.
 
 import asyncio
 import os
+from collections import defaultdict
 from utcp.utcp_client import UtcpClient
 from utcp.data.utcp_client_config import UtcpClientConfig
 from utcp_http.http_call_template import HttpCallTemplate
@@ -37,12 +38,6 @@ async def main():
         print("Set it with: export OPENAI_API_KEY=your_key_here")
         return
     
-    # Check for OpenAI API key
-    if not os.getenv("OPENAI_API_KEY"):
-        print("❌ OPENAI_API_KEY environment variable not set")
-        print("Set it with: export OPENAI_API_KEY=your_key_here")
-        return
-    
     print("✅ Dependencies and API key verified")
     
     # Create UTCP client
@@ -56,9 +51,9 @@ async def main():
     providers = [
         {
             "name": "openlibrary",
-            "provider": HttpProvider(
+            "provider": HttpCallTemplate(
                 name="openlibrary",
-                provider_type="http",
+                call_template_type="http",
                 http_method="GET",
                 url="https://openlibrary.org/static/openapi.json",
                 content_type="application/json"
@@ -67,9 +62,9 @@ async def main():
         },
         {
             "name": "petstore",
-            "provider": HttpProvider(
+            "provider": HttpCallTemplate(
                 name="petstore",
-                provider_type="http",
+                call_template_type="http",
                 url="https://petstore.swagger.io/v2/swagger.json",
                 http_method="GET"
             ),
@@ -77,15 +72,29 @@ async def main():
         }
     ]
     
-    registered_providers = []
+    # The specs are fetched concurrently, so registration takes as long as the
+    # slowest provider rather than the sum of all of them. Each provider is
+    # registered on its own so one that raises (e.g. a missing variable) does
+    # not take the others down with it.
     for provider_info in providers:
-        try:
-            print(f"  Registering {provider_info['name']}...")
-            await client.register_tool_provider(provider_info["provider"])
+        print(f"  Registering {provider_info['name']}...")
+    results = await asyncio.gather(
+        *(client.register_manual(provider_info["provider"]) for provider_info in providers),
+        return_exceptions=True,
+    )
+    
+    registered_providers = []
+    for provider_info, result in zip(providers, results):
+        if isinstance(result, Exception):
+            error = str(result)
+        elif result.success:
             registered_providers.append(provider_info["name"])
             print(f"    ✅ {provider_info['description']}")
-        except Exception as e:
-            print(f"    ❌ Failed to register {provider_info['name']}: {e}")
+            continue
+        else:
+            # errors holds full tracebacks; the last line names the failure
+            error = result.errors[-1].splitlines()[-1] if result.errors else "unknown error"
+        print(f"    ❌ Failed to register {provider_info['name']}: {error}")
     
     if not registered_providers:
         print("❌ No providers registered successfully. Cannot continue.")
@@ -98,20 +107,26 @@ async def main():
     tools = await load_utcp_tools(client)
     print(f"Loaded {len(tools)} tools from all providers:")
     
-    # Group tools by provider for better organization
-    tools_by_provider = {}
+    # Group tools by provider (manual name), building each provider's preview
+    # lines in the same pass
+    tools_by_provider = defaultdict(list)
+    previews = defaultdict(list)
     for tool in tools:
-        provider = tool.metadata.get('provider', 'unknown')
-        if provider not in tools_by_provider:
-            tools_by_provider[provider] = []
-        tools_by_provider[provider].append(tool)
-    
+        provider = tool.metadata.get('manual_name', 'unknown')
+        provider_tools = tools_by_provider[provider]
+        provider_tools.append(tool)
+        if len(provider_tools) <= 2:  # Show first 2 tools per provider
+            previews[provider].append(f"    - {tool.name}")
+    
+    # Collect the listing and print it in one write
+    lines = []
     for provider, provider_tools in tools_by_provider.items():
-        print(f"  📦 {provider}: {len(provider_tools)} tools")
-        for tool in provider_tools[:2]:  # Show first 2 tools per provider
-            print(f"    - {tool.name}")
+        lines.append(f"  📦 {provider}: {len(provider_tools)} tools")
+        lines.extend(previews[provider])
         if len(provider_tools) > 2:
-            print(f"    ... and {len(provider_tools) - 2} more")
+            lines.append(f"    ... and {len(provider_tools) - 2} more")
+    if lines:
+        print("\n".join(lines))
     
     if not tools:
         print("❌ No tools available. Cannot create agent.")
@@ -121,13 +136,19 @@ async def main():
     print("\n🔍 Demonstrating tool search...")
     search_queries = ["book", "pet", "search", "get"]
     
-    for query in search_queries:
-        results = await search_utcp_tools(client, query, max_results=3)
+    # The searches are independent, so run them together
+    all_results = await asyncio.gather(
+        *(search_utcp_tools(client, query, max_results=3) for query in search_queries)
+    )
+    lines = []
+    for query, results in zip(search_queries, all_results):
         if results:
-            print(f"  Query '{query}': {len(results)} tools found")
+            lines.append(f"  Query '{query}': {len(results)} tools found")
             for tool in results[:2]:
-                provider = tool.metadata.get('provider', 'unknown')
-                print(f"    - {tool.name} ({provider})")
+                provider = tool.metadata.get('manual_name', 'unknown')
+                lines.append(f"    - {tool.name} ({provider})")
+    if lines:
+        print("\n".join(lines))
     
     # Create LangGraph agent with UTCP tools
     print("\n🤖 Creating advanced LangGraph agent...")
@@ -160,7 +181,15 @@ async def main():
     
     print("\n💬 Testing agent with multiple scenarios...")
     
-    for i, scenario in enumerate(test_scenarios, 1):
+    # The scenarios are independent (each ainvoke carries its own state), so
+    # run them concurrently and print the results in order afterwards
+    responses = await asyncio.gather(
+        *(agent.ainvoke({"messages": [("user", scenario["query"])]})
+          for scenario in test_scenarios),
+        return_exceptions=True,
+    )
+    
+    for i, (scenario, response) in enumerate(zip(test_scenarios, responses), 1):
         print(f"\n{'='*50}")
         print(f"Test {i}: {scenario['name']}")
         print(f"{'='*50}")
@@ -169,9 +198,8 @@ async def main():
         print()
         
         try:
-            response = await agent.ainvoke({
-                "messages": [("user", scenario["query"])]
-            })
+            if isinstance(response, Exception):
+                raise response
             
             print("🤖 Agent Response:")
             print(response["messages"][-1].content)
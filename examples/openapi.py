@@ -5,12 +5,11 @@ into UTCP tools that can be used with LangChain.
 """
 
 import asyncio
-import json
-from pathlib import Path
+from collections import defaultdict
 
-from utcp.client.utcp_client import UtcpClient
-from utcp.client.utcp_client_config import UtcpClientConfig
-from utcp.shared.provider import HttpProvider
+from utcp.utcp_client import UtcpClient
+from utcp.data.utcp_client_config import UtcpClientConfig
+from utcp_http.http_call_template import HttpCallTemplate
 from langchain_utcp_adapters import load_utcp_tools, search_utcp_tools
 
 
@@ -23,12 +22,24 @@ async def main():
     print("OpenAPI specifications into usable tools.")
     print()
     
-    # Create UTCP client
-    config = UtcpClientConfig()
+    # Create UTCP client. Call templates known up front are passed in memory
+    # through the config, so no providers file is written, read and deleted.
+    print("📄 Configuring call templates in memory...")
+    config = UtcpClientConfig(
+        manual_call_templates=[
+            HttpCallTemplate(
+                name="jsonplaceholder",
+                call_template_type="http",
+                url="https://jsonplaceholder.typicode.com",
+                http_method="GET"
+            )
+        ]
+    )
     client = await UtcpClient.create(config=config)
+    print(f"✅ Configured {len(config.manual_call_templates)} call templates")
     
     # Example 1: Register OpenAPI specs directly as providers
-    print("📡 Registering OpenAPI providers...")
+    print("\n📡 Registering OpenAPI providers...")
     
     openapi_providers = [
         {
@@ -43,87 +54,85 @@ async def main():
         }
     ]
     
-    registered_providers = []
+    # The specs are fetched concurrently, so registration takes as long as the
+    # slowest spec rather than the sum of all of them. Each spec is registered
+    # on its own so one that raises does not take the others down with it.
     for provider_info in openapi_providers:
-        try:
-            print(f"  Registering {provider_info['name']}...")
-            provider = HttpProvider(
+        print(f"  Registering {provider_info['name']}...")
+    results = await asyncio.gather(
+        *(
+            client.register_manual(HttpCallTemplate(
                 name=provider_info["name"],
-                provider_type="http",
+                call_template_type="http",
                 url=provider_info["url"],
                 http_method="GET"
-            )
-            tools = await client.register_tool_provider(provider)
-            registered_providers.append(provider_info["name"])
-            print(f"    ✅ Registered {len(tools)} tools from {provider_info['name']}")
-        except Exception as e:
-            print(f"    ❌ Failed to register {provider_info['name']}: {e}")
-    
-    # Example 2: Create providers.json with OpenAPI URLs
-    print("\n📄 Creating providers.json with OpenAPI specs...")
-    providers_config = [
-        {
-            "name": "jsonplaceholder",
-            "provider_type": "http",
-            "url": "https://jsonplaceholder.typicode.com",
-            "http_method": "GET"
-        }
-    ]
+            ))
+            for provider_info in openapi_providers
+        ),
+        return_exceptions=True,
+    )
     
-    providers_file = Path("openapi_providers.json")
-    with open(providers_file, "w") as f:
-        json.dump(providers_config, f, indent=2)
-    
-    # Load additional providers from file
-    try:
-        additional_providers = await client.load_providers("openapi_providers.json")
-        print(f"✅ Loaded {len(additional_providers)} additional providers from file")
-    except Exception as e:
-        print(f"❌ Failed to load providers from file: {e}")
+    registered_providers = []
+    for provider_info, result in zip(openapi_providers, results):
+        if isinstance(result, Exception):
+            error = str(result)
+        elif result.success:
+            registered_providers.append(provider_info["name"])
+            print(f"    ✅ Registered {len(result.manual.tools)} tools from {provider_info['name']}")
+            continue
+        else:
+            # errors holds full tracebacks; the last line names the failure
+            error = result.errors[-1].splitlines()[-1] if result.errors else "unknown error"
+        print(f"    ❌ Failed to register {provider_info['name']}: {error}")
     
     # Load all tools and convert to LangChain format
     print("\n🔧 Loading all tools...")
     tools = await load_utcp_tools(client)
     print(f"Found {len(tools)} LangChain tools from OpenAPI specs:")
     
-    # Group tools by provider
-    tools_by_provider = {}
+    # Group tools by provider (manual name) in a single pass
+    tools_by_provider = defaultdict(list)
     for tool in tools:
-        provider = tool.metadata.get('provider', 'unknown')
-        if provider not in tools_by_provider:
-            tools_by_provider[provider] = []
-        tools_by_provider[provider].append(tool)
+        tools_by_provider[tool.metadata.get('manual_name', 'unknown')].append(tool)
     
+    # Collect the listing and print it in one write
+    lines = []
     for provider, provider_tools in tools_by_provider.items():
-        print(f"\n  📦 {provider} ({len(provider_tools)} tools):")
+        lines.append(f"\n  📦 {provider} ({len(provider_tools)} tools):")
         for tool in provider_tools[:3]:  # Show first 3 tools
-            print(f"    - {tool.name}: {tool.description}")
+            lines.append(f"    - {tool.name}: {tool.description}")
         if len(provider_tools) > 3:
-            print(f"    ... and {len(provider_tools) - 3} more tools")
+            lines.append(f"    ... and {len(provider_tools) - 3} more tools")
+    if lines:
+        print("\n".join(lines))
     
     # Search for specific functionality
     print("\n🔍 Searching for specific functionality...")
     search_queries = ["user", "post", "get", "pet"]
     
-    for query in search_queries:
-        results = await search_utcp_tools(client, query, max_results=3)
+    # The searches are independent, so run them together
+    all_results = await asyncio.gather(
+        *(search_utcp_tools(client, query, max_results=3) for query in search_queries)
+    )
+    lines = []
+    for query, results in zip(search_queries, all_results):
         if results:
-            print(f"\n  Query '{query}' found {len(results)} tools:")
+            lines.append(f"\n  Query '{query}' found {len(results)} tools:")
             for tool in results:
-                print(f"    - {tool.name} ({tool.metadata.get('provider')})")
+                lines.append(f"    - {tool.name} ({tool.metadata.get('manual_name')})")
+    if lines:
+        print("\n".join(lines))
     
     # Show detailed schema for one tool
     if tools:
         example_tool = tools[0]
         print(f"\n📋 Example tool schema for '{example_tool.name}':")
         print(f"  Description: {example_tool.description}")
-        print(f"  Provider: {example_tool.metadata.get('provider')}")
+        print(f"  Provider: {example_tool.metadata.get('manual_name')}")
         print(f"  Args schema: {example_tool.args_schema}")
         print(f"  Metadata: {example_tool.metadata}")
     
-    # Cleanup
-    if providers_file.exists():
-        providers_file.unlink()
+    await client.close()
     
     print("\n✅ OpenAPI integration example completed!")
     print(f"Successfully integrated {len(tools)} tools from OpenAPI specifications")
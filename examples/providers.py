@@ -15,7 +15,6 @@ from pathlib import Path
 from utcp.utcp_client import UtcpClient
 from utcp.data.utcp_client_config import UtcpClientConfig
 from utcp_http.http_call_template import HttpCallTemplate
-from utcp_text.text_call_template import TextCallTemplate
 from langchain_utcp_adapters import load_utcp_tools, search_utcp_tools
 
 
@@ -40,6 +39,9 @@ async def main():
     ]
     
     if newsapi_file.exists():
+        # Only import the text protocol plugin when there is a manual to load
+        from utcp_text.text_call_template import TextCallTemplate
+        
         call_templates.append(
             TextCallTemplate(
                 name="newsapi",
@@ -73,9 +75,15 @@ async def main():
     print("\n🔍 Searching for specific tools...")
     search_queries = ["search", "book", "author", "news"]
     
-    for query in search_queries:
+    # The searches are independent, so run them together
+    all_matches = await asyncio.gather(
+        *(search_utcp_tools(client, query, max_results=3) for query in search_queries),
+        return_exceptions=True,
+    )
+    for query, matching_tools in zip(search_queries, all_matches):
         try:
-            matching_tools = await search_utcp_tools(client, query, max_results=3)
+            if isinstance(matching_tools, Exception):
+                raise matching_tools
             if matching_tools:
                 print(f"\n  Query: '{query}' -> {len(matching_tools)} matches:")
                 for tool in matching_tools:
@@ -90,11 +98,11 @@ async def main():
         print(f"\n🚀 Testing tool execution...")
         
         # Try to find a simple tool to test
-        test_tool = None
-        for tool in langchain_tools:
-            if "search" in tool.name.lower() and "author" in tool.name.lower():
-                test_tool = tool
-                break
+        test_tool = next(
+            (tool for tool in langchain_tools
+             if "search" in (name := tool.name.lower()) and "author" in name),
+            None,
+        )
         
         if test_tool:
             try:
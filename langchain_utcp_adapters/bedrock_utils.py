@@ -5,11 +5,16 @@ This module provides utilities for formatting UTCP tools to work with Amazon Bed
 strict tool naming requirements.
 """
 
-import uuid
+import hashlib
+import itertools
+import re
 from typing import Dict, List, Tuple, Any, Optional
 from langchain_core.tools import BaseTool
 from langchain_core.runnables import RunnableConfig
 
+# Characters outside Bedrock's allowed tool-name alphabet
+_INVALID_BEDROCK_CHARS = re.compile(r"[^a-zA-Z0-9_-]")
+
 
 def format_tool_name_for_bedrock(tool_name: str) -> str:
     """
@@ -19,38 +24,55 @@ def format_tool_name_for_bedrock(tool_name: str) -> str:
     - Be 64 characters or less
     - Match pattern ^[a-zA-Z0-9_-]{1,64}$
     
+    Truncated names end in a hash of the original name, so a name maps to the
+    same Bedrock name on every call and in every process.
+    
     Args:
         tool_name: Original tool name
         
     Returns:
         Formatted tool name that meets Bedrock requirements
     """
-    # Replace periods with underscores (common in UTCP tool names)
-    bedrock_name = tool_name.replace(".", "_")
-    
-    # Remove any other invalid characters and replace with underscores
-    valid_chars = []
-    for char in bedrock_name:
-        if char.isalnum() or char in ['_', '-']:
-            valid_chars.append(char)
-        else:
-            valid_chars.append('_')
-    
-    bedrock_name = ''.join(valid_chars)
+    # Replace invalid characters, including the periods in namespaced UTCP
+    # tool names, with underscores
+    bedrock_name = _INVALID_BEDROCK_CHARS.sub("_", tool_name)
     
     # Truncate if longer than 64 characters
     if len(bedrock_name) > 64:
-        # Use first 55 chars + underscore + 8-char UUID
-        short_uuid = str(uuid.uuid4()).replace('-', '')[:8]
-        bedrock_name = f"{bedrock_name[:55]}_{short_uuid}"
+        # Use first 55 chars + underscore + 8-char hash of the original name
+        short_hash = hashlib.sha1(tool_name.encode()).hexdigest()[:8]
+        bedrock_name = f"{bedrock_name[:55]}_{short_hash}"
     
     return bedrock_name
 
 
+def _dedupe_bedrock_name(bedrock_name: str, taken: Dict[str, str]) -> str:
+    """
+    Make a Bedrock name unique by appending a numeric suffix.
+    
+    Args:
+        bedrock_name: Bedrock-compatible name that is already taken
+        taken: Bedrock names assigned so far
+        
+    Returns:
+        The first free name of the form ``<name>_<n>``, kept within 64 characters
+    """
+    for index in itertools.count(2):
+        suffix = f"_{index}"
+        candidate = f"{bedrock_name[:64 - len(suffix)]}{suffix}"
+        if candidate not in taken:
+            return candidate
+
+
 def create_bedrock_tool_mapping(tools: List[BaseTool]) -> Tuple[List[BaseTool], Dict[str, str]]:
     """
     Create Bedrock-compatible tools with name mapping.
     
+    Distinct names that format to the same Bedrock name (e.g. ``a.b`` and
+    ``a_b``) get a numeric suffix, since Bedrock rejects duplicate tool names.
+    Names that are already compatible are never renamed; only reformatted
+    names get a suffix, whatever the order of the tools.
+    
     Args:
         tools: List of LangChain tools with potentially incompatible names
         
@@ -59,26 +81,35 @@ def create_bedrock_tool_mapping(tools: List[BaseTool]) -> Tuple[List[BaseTool],
         - List of tools with Bedrock-compatible names
         - Mapping from Bedrock names to original names
     """
+    # Tools whose names are already compatible keep them, so reserve those
+    # names before any reformatted name can claim one
+    name_mapping = {
+        tool.name: tool.name
+        for tool in tools
+        if format_tool_name_for_bedrock(tool.name) == tool.name
+    }
     bedrock_tools = []
-    name_mapping = {}
     
     for tool in tools:
         original_name = tool.name
+        if name_mapping.get(original_name) == original_name:
+            # Name is already compatible, use original tool
+            bedrock_tools.append(tool)
+            continue
+        
         bedrock_name = format_tool_name_for_bedrock(original_name)
+        if name_mapping.get(bedrock_name, original_name) != original_name:
+            bedrock_name = _dedupe_bedrock_name(bedrock_name, name_mapping)
         
         # Store the mapping
         name_mapping[bedrock_name] = original_name
         
-        if bedrock_name == original_name:
-            # Name is already compatible, use original tool
-            bedrock_tools.append(tool)
-        else:
-            # Create a wrapper tool with the Bedrock-compatible name
-            bedrock_tool = BedrockCompatibleTool(
-                original_tool=tool,
-                bedrock_name=bedrock_name
-            )
-            bedrock_tools.append(bedrock_tool)
+        # Create a wrapper tool with the Bedrock-compatible name
+        bedrock_tool = BedrockCompatibleTool(
+            original_tool=tool,
+            bedrock_name=bedrock_name
+        )
+        bedrock_tools.append(bedrock_tool)
     
     return bedrock_tools, name_mapping
 
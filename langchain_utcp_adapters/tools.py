@@ -4,18 +4,156 @@ This module provides functionality to convert UTCP tools into LangChain-compatib
 tools, handle tool execution, and manage tool conversion between the two formats.
 """
 
+import asyncio
 import json
 import logging
-from typing import Any, Dict, List, Optional
+import math
+import time
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Any, Awaitable, Callable, Dict, List, Literal, Optional, Tuple, get_args
 
 from langchain_core.tools import BaseTool, StructuredTool, ToolException
 from pydantic import BaseModel, create_model, ConfigDict
 from utcp.utcp_client import UtcpClient
 from utcp.data.tool import Tool as UTCPTool
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
+
 # Configure logger for this module
 logger = logging.getLogger(__name__)
 
+# When tool results may be served from cache:
+# - "off": never cache (default)
+# - "safe-only": cache only tools called with a safe HTTP method (GET/HEAD)
+# - "always": cache every tool
+CachePolicy = Literal["always", "safe-only", "off"]
+
+_SAFE_HTTP_METHODS = ("GET", "HEAD")
+
+
+class _ToolResultCache:
+    """Bounded LRU cache of tool results that expire after a fixed TTL."""
+
+    def __init__(self, ttl: float, maxsize: int = 128) -> None:
+        """Initialize the cache.
+
+        Args:
+            ttl: Seconds a cached result stays valid
+            maxsize: Maximum number of results kept before evicting the oldest
+        """
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self._entries: OrderedDict[str, Tuple[float, str]] = OrderedDict()
+        self._pending: Dict[str, "asyncio.Future[str]"] = {}
+
+    def get(self, key: str) -> Optional[str]:
+        """Return the cached result for key, or None if missing or expired."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if expires_at <= time.monotonic():
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return value
+
+    def set(self, key: str, value: str) -> None:
+        """Store a result for key, evicting the least recently used if full."""
+        self._entries[key] = (time.monotonic() + self.ttl, value)
+        self._entries.move_to_end(key)
+        if len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    async def get_or_call(self, key: str, call: Callable[[], Awaitable[str]]) -> str:
+        """Return the cached result for key, or await call() to produce it.
+
+        Concurrent misses for the same key share one in-flight call rather
+        than each calling the tool, so identical calls made at the same time
+        hit the tool once. Failed calls are not cached.
+
+        Args:
+            key: Cache key of the call
+            call: Makes the call when there is no cached or in-flight result
+
+        Returns:
+            The result
+        """
+        cached = self.get(key)
+        if cached is not None:
+            return cached
+        pending = self._pending.get(key)
+        if pending is None:
+            pending = asyncio.ensure_future(call())
+            self._pending[key] = pending
+            pending.add_done_callback(lambda future: self._finish(key, future))
+        # Shielded so a cancelled caller doesn't cancel the call for the others
+        return await asyncio.shield(pending)
+
+    def _finish(self, key: str, future: "asyncio.Future[str]") -> None:
+        """Cache the result of a finished in-flight call if it succeeded."""
+        if self._pending.get(key) is future:
+            del self._pending[key]
+        if not future.cancelled() and future.exception() is None:
+            self.set(key, future.result())
+
+
+def _orjson_matches_stdlib(obj: Any) -> bool:
+    """Check whether orjson would serialize obj byte-for-byte like json.dumps.
+
+    orjson writes non-finite floats as null, small floats without an
+    exponent, and dates, UUIDs, enums and dataclasses natively, all of which
+    the stdlib handles differently. Results holding any of those go through
+    the stdlib instead.
+
+    Args:
+        obj: The object to check
+
+    Returns:
+        True if obj only holds plain JSON types with string keys
+    """
+    stack = [obj]
+    while stack:
+        value = stack.pop()
+        kind = type(value)
+        if kind is dict:
+            if any(type(key) is not str for key in value):
+                return False
+            stack.extend(value.values())
+        elif kind is list or kind is tuple:
+            stack.extend(value)
+        elif kind is float:
+            if not math.isfinite(value) or (value and not 1e-4 <= abs(value) < 1e16):
+                return False
+        elif kind not in (str, int, bool, type(None)):
+            return False
+    return True
+
+
+def _dumps_json(obj: Any) -> str:
+    """Serialize a tool result to indented JSON, using orjson when available.
+
+    The output is the same as ``json.dumps(obj, indent=2, ensure_ascii=False)``
+    whether or not orjson is installed.
+
+    Args:
+        obj: A JSON-compatible object
+
+    Returns:
+        The JSON string
+    """
+    if orjson is not None and _orjson_matches_stdlib(obj):
+        try:
+            return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode()
+        except TypeError:
+            # e.g. integers beyond 64 bits or lone surrogates; let the stdlib handle it
+            pass
+    return json.dumps(obj, indent=2, ensure_ascii=False)
+
 
 def _convert_utcp_result(result: Any) -> str:
     """Convert UTCP tool result to LangChain tool result format.
@@ -33,7 +171,7 @@ def _convert_utcp_result(result: Any) -> str:
         raise ToolException(str(result["error"]))
     
     if isinstance(result, (dict, list)):
-        return json.dumps(result, indent=2)
+        return _dumps_json(result)
     
     return str(result)
 
@@ -101,6 +239,44 @@ def _create_pydantic_model_from_schema(
     return create_model(model_name, **field_definitions)
 
 
+@lru_cache(maxsize=1024)
+def _create_pydantic_model_from_schema_json(
+    schema_json: str,
+    model_name: str,
+) -> type[BaseModel]:
+    """Create (and memoize) a Pydantic model from a canonical JSON schema string.
+
+    Args:
+        schema_json: JSON schema serialized with sorted keys
+        model_name: Name for the generated model
+
+    Returns:
+        A Pydantic BaseModel class
+    """
+    return _create_pydantic_model_from_schema(json.loads(schema_json), model_name)
+
+
+def _get_args_schema(schema: Dict[str, Any], model_name: str) -> type[BaseModel]:
+    """Get the Pydantic args model for a tool input schema.
+
+    Tools are converted again on every load and search, so models are memoized
+    on the canonical schema and name instead of being rebuilt each time.
+
+    Args:
+        schema: JSON schema dictionary
+        model_name: Name for the generated model
+
+    Returns:
+        A Pydantic BaseModel class
+    """
+    try:
+        schema_json = json.dumps(schema, sort_keys=True)
+    except (TypeError, ValueError):
+        # Not JSON serializable, so it can't be used as a cache key
+        return _create_pydantic_model_from_schema(schema, model_name)
+    return _create_pydantic_model_from_schema_json(schema_json, model_name)
+
+
 def _json_schema_to_python_type(schema: Dict[str, Any]) -> type:
     """Convert JSON schema type to Python type.
 
@@ -147,22 +323,71 @@ def _json_schema_to_python_type(schema: Dict[str, Any]) -> type:
     return type_mapping.get(schema_type, str)  # Default to str for unknown types
 
 
+def _get_call_template(tool: UTCPTool) -> Optional[Any]:
+    """Get the call template of a UTCP tool.
+
+    Uses a single getattr lookup instead of hasattr checks, which cost an
+    exception when the attribute is missing.
+
+    Args:
+        tool: UTCP tool to inspect
+
+    Returns:
+        The tool's call template, or None if it has none
+    """
+    return getattr(tool, "tool_call_template", None)
+
+
+def _is_cacheable(tool: UTCPTool, cache_policy: CachePolicy) -> bool:
+    """Check whether results of a UTCP tool may be cached under a cache policy.
+
+    Args:
+        tool: UTCP tool to check
+        cache_policy: The cache policy in effect
+
+    Returns:
+        True if the tool's results may be cached
+    """
+    if cache_policy == "always":
+        return True
+    if cache_policy == "safe-only":
+        http_method = getattr(_get_call_template(tool), "http_method", None)
+        return isinstance(http_method, str) and http_method.upper() in _SAFE_HTTP_METHODS
+    return False
+
+
 def convert_utcp_tool_to_langchain_tool(
     utcp_client: UtcpClient,
     tool: UTCPTool,
+    cache_policy: CachePolicy = "off",
+    cache_ttl: float = 300.0,
 ) -> BaseTool:
     """Convert a UTCP tool to a LangChain tool.
 
     Args:
         utcp_client: UTCP client instance for tool execution
         tool: UTCP tool to convert
+        cache_policy: When repeated calls with the same arguments may reuse a
+            previous result: "off", "safe-only" (GET/HEAD HTTP tools) or "always"
+        cache_ttl: Seconds a cached result stays valid
 
     Returns:
         A LangChain tool
+
+    Raises:
+        ValueError: If cache_policy is not a known cache policy
     """
+    if cache_policy not in get_args(CachePolicy):
+        raise ValueError(
+            f"Unknown cache_policy {cache_policy!r}; "
+            f"expected one of {', '.join(map(repr, get_args(CachePolicy)))}"
+        )
+    result_cache = (
+        _ToolResultCache(cache_ttl) if _is_cacheable(tool, cache_policy) else None
+    )
     
-    async def call_tool(**arguments: Dict[str, Any]) -> str:
-        """Execute the UTCP tool with given arguments."""
+    async def call_uncached(arguments: Dict[str, Any]) -> str:
+        """Call the UTCP tool and convert its result."""
         try:
             # Tool names from UTCP are already properly namespaced as 'manual_name.tool_name'
             # The UTCP client handles the namespacing during tool registration
@@ -170,6 +395,13 @@ def convert_utcp_tool_to_langchain_tool(
             return _convert_utcp_result(result)
         except Exception as e:
             raise ToolException(f"Error calling UTCP tool {tool.name}: {str(e)}") from e
+    
+    async def call_tool(**arguments: Dict[str, Any]) -> str:
+        """Execute the UTCP tool with given arguments."""
+        if result_cache is None:
+            return await call_uncached(arguments)
+        cache_key = json.dumps(arguments, sort_keys=True, default=str)
+        return await result_cache.get_or_call(cache_key, lambda: call_uncached(arguments))
 
     # Create Pydantic model from tool input schema
     # Handle JsonSchema object from UTCP 1.0.1+
@@ -186,7 +418,7 @@ def convert_utcp_tool_to_langchain_tool(
         # Unknown format, create empty schema
         schema_dict = {"type": "object", "properties": {}}
     
-    args_schema = _create_pydantic_model_from_schema(
+    args_schema = _get_args_schema(
         schema_dict,
         f"{tool.name.replace('.', '_')}Input"
     )
@@ -196,11 +428,9 @@ def convert_utcp_tool_to_langchain_tool(
     manual_name = tool.name.split('.')[0] if '.' in tool.name else "unknown"
     
     # Get call template type from the tool's call template with proper validation
-    call_template_type = "unknown"
-    if (hasattr(tool, 'tool_call_template') and 
-        tool.tool_call_template is not None and 
-        hasattr(tool.tool_call_template, 'call_template_type')):
-        call_template_type = tool.tool_call_template.call_template_type
+    call_template_type = getattr(
+        _get_call_template(tool), "call_template_type", "unknown"
+    )
     
     return StructuredTool(
         name=tool.name,  # Use the full namespaced name from UTCP (manual_name.tool_name)
@@ -220,12 +450,17 @@ def convert_utcp_tool_to_langchain_tool(
 async def load_utcp_tools(
     utcp_client: UtcpClient,
     call_template_name: Optional[str] = None,
+    cache_policy: CachePolicy = "off",
+    cache_ttl: float = 300.0,
 ) -> List[BaseTool]:
     """Load all available UTCP tools and convert them to LangChain tools.
 
     Args:
         utcp_client: The UTCP client instance
         call_template_name: Optional call template name to filter tools
+        cache_policy: Result cache policy for the returned tools, see
+            convert_utcp_tool_to_langchain_tool
+        cache_ttl: Seconds a cached result stays valid
 
     Returns:
         List of LangChain tools
@@ -242,10 +477,7 @@ async def load_utcp_tools(
         # Improved filtering with better null checks
         filtered_tools = []
         for tool in all_tools:
-            if (hasattr(tool, 'tool_call_template') and 
-                tool.tool_call_template is not None and
-                hasattr(tool.tool_call_template, 'name')):
-                
+            if getattr(_get_call_template(tool), "name", None) is not None:
                 # Extract manual name from tool name for comparison
                 tool_manual_name = tool.name.split('.')[0] if '.' in tool.name else "unknown"
                 
@@ -258,7 +490,9 @@ async def load_utcp_tools(
     langchain_tools = []
     for utcp_tool in all_tools:
         try:
-            langchain_tool = convert_utcp_tool_to_langchain_tool(utcp_client, utcp_tool)
+            langchain_tool = convert_utcp_tool_to_langchain_tool(
+                utcp_client, utcp_tool, cache_policy, cache_ttl
+            )
             langchain_tools.append(langchain_tool)
         except Exception as e:
             # Log the error but continue with other tools
@@ -272,6 +506,8 @@ async def search_utcp_tools(
     query: str,
     call_template_name: Optional[str] = None,
     max_results: Optional[int] = None,
+    cache_policy: CachePolicy = "off",
+    cache_ttl: float = 300.0,
 ) -> List[BaseTool]:
     """Search for UTCP tools and convert them to LangChain tools.
 
@@ -280,6 +516,9 @@ async def search_utcp_tools(
         query: Search query string
         call_template_name: Optional call template name to filter tools
         max_results: Maximum number of results to return
+        cache_policy: Result cache policy for the returned tools, see
+            convert_utcp_tool_to_langchain_tool
+        cache_ttl: Seconds a cached result stays valid
 
     Returns:
         List of relevant LangChain tools
@@ -303,10 +542,10 @@ async def search_utcp_tools(
             search_results = []
             
             for tool in all_tools:
-                # Search in name, description, and tags
-                if (query_lower in tool.name.lower() or 
-                    query_lower in tool.description.lower() or
-                    any(query_lower in tag.lower() for tag in tool.tags)):
+                # Search in name, description, and tags, joined with NUL so a
+                # match can't span two fields
+                search_text = "\0".join((tool.name, tool.description or "", *tool.tags))
+                if query_lower in search_text.lower():
                     search_results.append(tool)
             
             logger.info("Fallback search found %d matching tools", len(search_results))
@@ -318,16 +557,19 @@ async def search_utcp_tools(
             try:
                 logger.info("Trying to load all tools via load_utcp_tools...")
                 # Use the load function which might have different error handling
-                all_langchain_tools = await load_utcp_tools(utcp_client, call_template_name)
+                all_langchain_tools = await load_utcp_tools(
+                    utcp_client, call_template_name, cache_policy, cache_ttl
+                )
                 
                 # Filter the LangChain tools by query
                 query_lower = query.lower()
                 filtered_tools = []
                 
                 for tool in all_langchain_tools:
-                    if (query_lower in tool.name.lower() or 
-                        query_lower in tool.description.lower() or
-                        any(query_lower in tag.lower() for tag in tool.metadata.get("tags", []))):
+                    search_text = "\0".join(
+                        (tool.name, tool.description or "", *tool.metadata.get("tags", []))
+                    )
+                    if query_lower in search_text.lower():
                         filtered_tools.append(tool)
                 
                 # Apply max_results limit if specified
@@ -348,18 +590,17 @@ async def search_utcp_tools(
     # Filter by call template if specified
     if call_template_name:
         search_results = [
-            tool for tool in search_results 
-            if hasattr(tool, 'tool_call_template') and 
-               tool.tool_call_template is not None and
-               hasattr(tool.tool_call_template, 'name') and 
-               tool.tool_call_template.name == call_template_name
+            tool for tool in search_results
+            if getattr(_get_call_template(tool), "name", None) == call_template_name
         ]
     
     # Convert each UTCP tool to a LangChain tool
     langchain_tools = []
     for utcp_tool in search_results:
         try:
-            langchain_tool = convert_utcp_tool_to_langchain_tool(utcp_client, utcp_tool)
+            langchain_tool = convert_utcp_tool_to_langchain_tool(
+                utcp_client, utcp_tool, cache_policy, cache_ttl
+            )
             langchain_tools.append(langchain_tool)
         except Exception as e:
             # Log the error but continue with other tools
@@ -0,0 +1,88 @@
+"""Tests for Bedrock compatibility utilities."""
+
+import hashlib
+
+from langchain_core.tools import StructuredTool
+
+from langchain_utcp_adapters.bedrock_utils import (
+    BedrockCompatibleTool,
+    create_bedrock_tool_mapping,
+    format_tool_name_for_bedrock,
+)
+
+
+async def _echo(text: str) -> str:
+    return text
+
+
+def _make_tool(name: str) -> StructuredTool:
+    return StructuredTool.from_function(coroutine=_echo, name=name, description="Echo")
+
+
+class TestBedrockUtils:
+    """Test Bedrock tool name formatting and mapping."""
+
+    def test_format_tool_name_for_bedrock(self):
+        """Test that invalid characters are replaced."""
+        assert format_tool_name_for_bedrock("manual.tool name") == "manual_tool_name"
+        assert format_tool_name_for_bedrock("already_valid-name") == "already_valid-name"
+
+    def test_format_tool_name_for_bedrock_non_ascii(self):
+        """Test that non-ASCII letters are replaced too."""
+        assert format_tool_name_for_bedrock("café.menü") == "caf__men_"
+
+    def test_format_long_tool_name_is_stable(self):
+        """Test that truncated names map to the same Bedrock name every time."""
+        long_name = "manual." + "x" * 100
+        formatted = format_tool_name_for_bedrock(long_name)
+        assert len(formatted) <= 64
+        assert format_tool_name_for_bedrock(long_name) == formatted
+        assert formatted == f"manual_{'x' * 48}_{hashlib.sha1(long_name.encode()).hexdigest()[:8]}"
+        assert format_tool_name_for_bedrock(long_name + "y") != formatted
+
+    def test_create_bedrock_tool_mapping(self):
+        """Test that only incompatible names are wrapped."""
+        valid = _make_tool("valid_name")
+        dotted = _make_tool("manual.tool")
+
+        bedrock_tools, name_mapping = create_bedrock_tool_mapping([valid, dotted])
+
+        assert bedrock_tools[0] is valid
+        assert isinstance(bedrock_tools[1], BedrockCompatibleTool)
+        assert bedrock_tools[1].name == "manual_tool"
+        assert bedrock_tools[1].original_tool is dotted
+        assert name_mapping == {"valid_name": "valid_name", "manual_tool": "manual.tool"}
+
+    def test_create_bedrock_tool_mapping_dedupes_names(self):
+        """Test that names formatting to the same Bedrock name stay distinct."""
+        underscored = _make_tool("manual_tool")
+        dotted = _make_tool("manual.tool")
+
+        bedrock_tools, name_mapping = create_bedrock_tool_mapping([underscored, dotted])
+
+        assert [tool.name for tool in bedrock_tools] == ["manual_tool", "manual_tool_2"]
+        assert name_mapping == {"manual_tool": "manual_tool", "manual_tool_2": "manual.tool"}
+
+    def test_create_bedrock_tool_mapping_keeps_compatible_names(self):
+        """Test that a compatible name wins over an earlier tool formatting to it."""
+        dotted = _make_tool("manual.tool")
+        underscored = _make_tool("manual_tool")
+
+        bedrock_tools, name_mapping = create_bedrock_tool_mapping([dotted, underscored])
+
+        assert [tool.name for tool in bedrock_tools] == ["manual_tool_2", "manual_tool"]
+        assert bedrock_tools[1] is underscored
+        assert name_mapping == {"manual_tool": "manual_tool", "manual_tool_2": "manual.tool"}
+
+    def test_create_bedrock_tool_mapping_reflects_tool_changes(self):
+        """Test that wrappers built on a later call pick up changes to the tool."""
+        tool = _make_tool("manual.tool")
+
+        first, _ = create_bedrock_tool_mapping([tool])
+        tool.description = "Changed"
+        tool.metadata = {"manual_name": "manual"}
+        second, _ = create_bedrock_tool_mapping([tool])
+
+        assert first[0].description == "Echo"
+        assert second[0].description == "Changed"
+        assert second[0].metadata == {"manual_name": "manual", "original_name": "manual.tool"}
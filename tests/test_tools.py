@@ -32,6 +32,36 @@ class TestToolConversion:
         assert '"message"' in converted and '"success"' in converted
         assert '"data"' in converted and '1' in converted and '2' in converted and '3' in converted
 
+    def test_convert_utcp_result_matches_stdlib_json(self):
+        """Test that result JSON is the same with or without orjson."""
+        import json
+        import uuid
+
+        results = [
+            {"name": "Café", "items": [1, 2.5, None, True], "nested": {"a": []}},
+            {"nan": float("nan"), "inf": [float("inf"), float("-inf")]},
+            {"small": [1e-7, 1e-5, -3e-5], "large": [1e16, 1e21, 0.0, -0.0]},
+            {1: "int key", "ok": True},
+            [{"big": 2**70, "id": uuid.UUID(int=0).hex}],
+        ]
+        for result in results:
+            expected = json.dumps(result, indent=2, ensure_ascii=False)
+            assert _convert_utcp_result(result) == expected
+            with patch("langchain_utcp_adapters.tools.orjson", None):
+                assert _convert_utcp_result(result) == expected
+
+    def test_convert_utcp_result_non_json_types_raise(self):
+        """Test that non-JSON values fail the same way with or without orjson."""
+        import datetime
+        import uuid
+
+        for value in (datetime.date(2024, 1, 1), uuid.UUID(int=0)):
+            with pytest.raises(TypeError):
+                _convert_utcp_result({"value": value})
+            with patch("langchain_utcp_adapters.tools.orjson", None):
+                with pytest.raises(TypeError):
+                    _convert_utcp_result({"value": value})
+
     def test_convert_utcp_result_error(self):
         """Test converting error result."""
         result = {"error": "Something went wrong"}
@@ -90,6 +120,34 @@ class TestToolConversion:
         model_instance = model_class()
         assert model_instance is not None
 
+    def test_args_schema_reused_across_conversions(self):
+        """Test that converting the same tool twice reuses its args model."""
+        provider = HttpCallTemplate(
+            name="test_provider",
+            call_template_type="http",
+            url="http://example.com/api",
+            http_method="GET"
+        )
+        utcp_tool = UTCPTool(
+            name="test_provider.reused_tool",
+            description="A tool converted twice",
+            inputs=JsonSchema(
+                type="object",
+                properties={"q": JsonSchema(type="string")},
+                required=["q"]
+            ),
+            outputs=JsonSchema(type="object", properties={}),
+            tags=[],
+            tool_call_template=provider
+        )
+
+        mock_client = AsyncMock()
+        first = convert_utcp_tool_to_langchain_tool(mock_client, utcp_tool)
+        second = convert_utcp_tool_to_langchain_tool(mock_client, utcp_tool)
+
+        assert first.args_schema is second.args_schema
+        assert first.args_schema(q="x").q == "x"
+
     def test_tool_name_without_namespace(self):
         """Test tool name handling for tools without namespace (edge case)."""
         from utcp_http.http_call_template import HttpCallTemplate
@@ -173,6 +231,121 @@ class TestToolConversion:
             {"input_text": "hello"}
         )
 
+    @pytest.mark.asyncio
+    async def test_tool_result_cache_safe_only(self):
+        """Test that safe-only caching reuses results for GET tools only."""
+        mock_client = AsyncMock()
+        mock_client.call_tool.return_value = {"result": "success"}
+
+        get_tool = UTCPTool(
+            name="test_provider.get_tool",
+            description="A GET tool",
+            inputs=JsonSchema(type="object", properties={"q": JsonSchema(type="string")}),
+            outputs=JsonSchema(type="object", properties={}),
+            tags=[],
+            tool_call_template=HttpCallTemplate(
+                name="test_provider", call_template_type="http",
+                url="http://example.com/api", http_method="GET"
+            )
+        )
+        post_tool = get_tool.model_copy(update={
+            "name": "test_provider.post_tool",
+            "tool_call_template": HttpCallTemplate(
+                name="test_provider", call_template_type="http",
+                url="http://example.com/api", http_method="POST"
+            ),
+        })
+
+        cached = convert_utcp_tool_to_langchain_tool(mock_client, get_tool, cache_policy="safe-only")
+        await cached.ainvoke({"q": "a"})
+        await cached.ainvoke({"q": "a"})
+        assert mock_client.call_tool.call_count == 1
+        await cached.ainvoke({"q": "b"})
+        assert mock_client.call_tool.call_count == 2
+
+        mock_client.call_tool.reset_mock()
+        uncached = convert_utcp_tool_to_langchain_tool(mock_client, post_tool, cache_policy="safe-only")
+        await uncached.ainvoke({"q": "a"})
+        await uncached.ainvoke({"q": "a"})
+        assert mock_client.call_tool.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_tool_result_cache_shares_concurrent_calls(self):
+        """Test that identical calls in flight at once make a single tool call."""
+        import asyncio
+
+        release = asyncio.Event()
+
+        async def slow_call(name, arguments):
+            await release.wait()
+            return {"result": arguments["q"]}
+
+        mock_client = AsyncMock()
+        mock_client.call_tool.side_effect = slow_call
+
+        utcp_tool = UTCPTool(
+            name="test_provider.get_tool",
+            description="A GET tool",
+            inputs=JsonSchema(type="object", properties={"q": JsonSchema(type="string")}),
+            outputs=JsonSchema(type="object", properties={}),
+            tags=[],
+            tool_call_template=HttpCallTemplate(
+                name="test_provider", call_template_type="http",
+                url="http://example.com/api", http_method="GET"
+            )
+        )
+
+        langchain_tool = convert_utcp_tool_to_langchain_tool(mock_client, utcp_tool, cache_policy="safe-only")
+        calls = asyncio.gather(*(langchain_tool.ainvoke({"q": "a"}) for _ in range(3)))
+        await asyncio.sleep(0)
+        release.set()
+        results = await calls
+
+        assert len(set(results)) == 1
+        assert mock_client.call_tool.call_count == 1
+        await langchain_tool.ainvoke({"q": "a"})
+        assert mock_client.call_tool.call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_tool_result_cache_off_by_default(self):
+        """Test that tool results are not cached unless a policy is given."""
+        mock_client = AsyncMock()
+        mock_client.call_tool.return_value = "ok"
+
+        utcp_tool = UTCPTool(
+            name="test_provider.get_tool",
+            description="A GET tool",
+            inputs=JsonSchema(type="object", properties={}),
+            outputs=JsonSchema(type="object", properties={}),
+            tags=[],
+            tool_call_template=HttpCallTemplate(
+                name="test_provider", call_template_type="http",
+                url="http://example.com/api", http_method="GET"
+            )
+        )
+
+        langchain_tool = convert_utcp_tool_to_langchain_tool(mock_client, utcp_tool)
+        await langchain_tool.ainvoke({})
+        await langchain_tool.ainvoke({})
+        assert mock_client.call_tool.call_count == 2
+
+    def test_unknown_cache_policy_raises(self):
+        """Test that a misspelled cache policy is rejected instead of disabling caching."""
+        utcp_tool = UTCPTool(
+            name="test_provider.get_tool",
+            description="A GET tool",
+            inputs=JsonSchema(type="object", properties={}),
+            outputs=JsonSchema(type="object", properties={}),
+            tags=[],
+            tool_call_template=HttpCallTemplate(
+                name="test_provider", call_template_type="http",
+                url="http://example.com/api", http_method="GET"
+            )
+        )
+
+        with pytest.raises(ValueError, match="safe_only"):
+            convert_utcp_tool_to_langchain_tool(AsyncMock(), utcp_tool, cache_policy="safe_only")
+
     @pytest.mark.asyncio
     async def test_load_utcp_tools(self):
         """Test loading UTCP tools."""